@@ -16,6 +16,7 @@ import sys
 sys.path.insert(0, os.path.dirname(__file__))
 
 from static_analyzer import analyze_file, analyze_directory
+from codegen import generate_jit_module
 
 
 def main():
@@ -32,11 +33,16 @@ def main():
         default=None,
         help="Optional path to write JSON output file",
     )
+    parser.add_argument(
+        "--emit-jit",
+        action="store_true",
+        help="Write <module>_jit.py with Numba @njit equivalents of flagged functions",
+    )
     parser.add_argument(
         "--pretty",
         action="store_true",
-        default=True,
-        help="Pretty-print JSON output",
+        default=None,
+        help="Pretty-print JSON output (default: only when stdout is a TTY)",
     )
     args = parser.parse_args()
 
@@ -52,17 +58,30 @@ def main():
     else:
         result = analyze_file(target)
 
-    indent = 2 if args.pretty else None
-    output_json = json.dumps(result, indent=indent)
+    if args.emit_jit:
+        file_results = result["files"] if result.get("type") == "directory" else [result]
+        for file_result in file_results:
+            if file_result.get("error"):
+                continue
+            jit_path = generate_jit_module(file_result["file"], file_result)
+            if jit_path:
+                print(f"[flintx] Numba equivalents written to: {jit_path}", file=sys.stderr)
+
+    # Indent only for humans at a terminal; pipes (the Rust CLI) get
+    # compact JSON, which skips indent generation on MB-sized reports.
+    pretty = args.pretty if args.pretty is not None else sys.stdout.isatty()
+    indent = 2 if pretty else None
 
-    # Always print to stdout (Rust CLI will capture this)
-    print(output_json)
+    # Always stream to stdout (Rust CLI will capture this) — json.dump
+    # avoids materializing the full report string in memory.
+    json.dump(result, sys.stdout, indent=indent)
+    sys.stdout.write("\n")
 
     # Optionally write to file
     if args.output:
         os.makedirs(os.path.dirname(args.output) if os.path.dirname(args.output) else ".", exist_ok=True)
         with open(args.output, "w") as f:
-            f.write(output_json)
+            json.dump(result, f, indent=indent)
         print(f"\n[flintx] Analysis saved to: {args.output}", file=sys.stderr)
 
 
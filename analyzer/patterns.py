@@ -8,7 +8,7 @@ Defines:
 """
 
 # Calls that are expensive inside loops
-EXPENSIVE_CALLS = {
+EXPENSIVE_CALLS = frozenset({
     # Math operations
     "sqrt", "pow", "log", "log2", "log10", "exp",
     "sin", "cos", "tan", "atan2", "hypot",
@@ -22,23 +22,28 @@ EXPENSIVE_CALLS = {
     "run", "call", "Popen",
     # Recursive triggers (common names)
     "fibonacci", "factorial", "fib",
-}
+})
 
 # Attribute calls considered expensive: e.g. time.sleep, math.sqrt
-EXPENSIVE_ATTR_CALLS = {
+EXPENSIVE_ATTR_CALLS = frozenset({
     ("math", "sqrt"), ("math", "pow"), ("math", "log"),
     ("math", "sin"),  ("math", "cos"), ("math", "exp"),
     ("time", "sleep"), ("os", "system"), ("random", "random"),
     ("random", "uniform"), ("random", "randint"),
-}
+})
+
+# Precomputed "module.func" display labels for the known-expensive calls,
+# so the AST walk doesn't rebuild the same strings per occurrence
+EXPENSIVE_LABELS = {key: f"{key[0]}.{key[1]}" for key in EXPENSIVE_ATTR_CALLS}
+EXPENSIVE_LABELS.update({(None, func): func for func in EXPENSIVE_CALLS})
 
 # Patterns that suggest data-parallel workloads
-DATA_PARALLEL_PATTERNS = {
+DATA_PARALLEL_PATTERNS = frozenset({
     "element_wise_loop",     # loop over rows + loop over cols applying same op
     "map_pattern",           # applying same function to every element
     "reduction_loop",        # accumulating sum/product manually
     "matrix_row_operation",  # operating on each row independently
-}
+})
 
 # Thresholds
 COMPLEXITY_THRESHOLD       = 7    # cyclomatic complexity above this → flagged
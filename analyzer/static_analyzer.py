@@ -6,243 +6,472 @@ Returns a structured dict ready for JSON serialization.
 """
 
 import ast
+import hashlib
+import json
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 from patterns import (
     EXPENSIVE_CALLS,
     EXPENSIVE_ATTR_CALLS,
+    EXPENSIVE_LABELS,
     COMPLEXITY_THRESHOLD,
     LOOP_DEPTH_THRESHOLD,
     FUNCTION_LENGTH_THRESHOLD,
 )
 
 
+# ── Result Cache ──────────────────────────────────────────────────────────────
+
+# Bump whenever the analysis output format or detector behavior changes,
+# so stale cache entries from older analyzer versions are never served.
+_CACHE_VERSION = 4
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "flintx")
+
+# Below this many files the fork + pickle overhead of a process pool
+# outweighs the parallel speedup, so analyze_directory stays sequential.
+_PARALLEL_MIN_FILES = 8
+
+# Files larger than this (generated code, vendored bundles) are skipped:
+# parse time would dwarf the value of the findings.
+_MAX_FILE_BYTES = 2_000_000
+
+
+def _cache_path(abspath: str, st: os.stat_result) -> str:
+    """Cache file path for a source file, keyed by (path, mtime, size)."""
+    key = f"{abspath}:{st.st_mtime_ns}:{st.st_size}:{_CACHE_VERSION}"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{digest}.json")
+
+
+def _cache_load(cache_file: str) -> dict[str, Any] | None:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_store(cache_file: str, result: dict[str, Any]) -> None:
+    """Write a result atomically so concurrent analyzers never see torn files."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass    # cache is best-effort; analysis already succeeded
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Marks "not computed yet" on a node, since None is a valid cached value.
+_SENTINEL = object()
+
+
 def _get_call_name(node: ast.Call) -> tuple[str, str] | None:
-    """Extract (module, func) or (None, func) from a Call node."""
-    if isinstance(node.func, ast.Attribute):
-        if isinstance(node.func.value, ast.Name):
-            return (node.func.value.id, node.func.attr)
-    if isinstance(node.func, ast.Name):
-        return (None, node.func.id)
-    return None
+    """
+    Extract (module, func) or (None, func) from a Call node.
+    The result is cached as an attribute on the node itself, since the
+    same Call nodes are inspected by several detectors.
+    """
+    name = getattr(node, "_flintx_name", _SENTINEL)
+    if name is not _SENTINEL:
+        return name
+    # AST node classes are never subclassed here, so exact-type checks
+    # (a pointer compare) replace isinstance in this hot helper.
+    name = None
+    func = node.func
+    if func.__class__ is ast.Attribute:
+        if func.value.__class__ is ast.Name:
+            name = (func.value.id, func.attr)
+    elif func.__class__ is ast.Name:
+        name = (None, func.id)
+    node._flintx_name = name
+    return name
 
 
 def _is_expensive_call(node: ast.Call) -> bool:
+    expensive = getattr(node, "_flintx_expensive", _SENTINEL)
+    if expensive is not _SENTINEL:
+        return expensive
     name = _get_call_name(node)
-    if name is None:
-        return False
-    module, func = name
-    if (module, func) in EXPENSIVE_ATTR_CALLS:
-        return True
-    if func in EXPENSIVE_CALLS:
-        return True
-    return False
+    expensive = name is not None and (
+        name in EXPENSIVE_ATTR_CALLS or name[1] in EXPENSIVE_CALLS
+    )
+    node._flintx_expensive = expensive
+    return expensive
 
 
-# ── Loop Depth Detector ───────────────────────────────────────────────────────
+# ── Single-Pass Pre-Indexer ──────────────────────────────────────────────────
 
-class LoopDepthVisitor(ast.NodeVisitor):
-    """
-    Finds all loops and measures their nesting depth.
-    Also collects expensive calls found inside loops.
+class PreIndexer:
     """
+    Walks the tree exactly once and buckets every node the downstream
+    detectors care about, keyed by enclosing function and enclosing loop.
+    Replaces the repeated per-function / per-loop `ast.walk` scans (which
+    were quadratic on nested functions and loops).
 
-    def __init__(self):
-        self.findings = []          # list of dicts per loop finding
-        self._depth = 0
-        self._loop_stack = []       # stack of (depth, lineno)
+    Traversal uses an explicit stack rather than NodeVisitor recursion:
+    no Python frame per node, and deep ASTs can't hit the recursion limit.
+    """
 
-    def _visit_loop(self, node):
-        self._depth += 1
-        self._loop_stack.append((self._depth, node.lineno))
+    _BUCKET_KEYS = (
+        "fors", "whiles", "ifs", "own_calls", "augassigns",
+        "boolops", "withs", "asserts", "handlers",
+    )
 
-        # Scan for expensive calls at this loop level
-        expensive_found = []
-        for child in ast.walk(node):
-            if child is node:
-                continue
-            # Don't descend into nested loops for call detection here
-            if isinstance(child, (ast.For, ast.While)) and child is not node:
-                break
-            if isinstance(child, ast.Call) and _is_expensive_call(child):
-                call_name = _get_call_name(child)
-                if call_name:
-                    expensive_found.append(
+    def __init__(self):
+        self.functions = []     # FunctionDef / AsyncFunctionDef nodes, preorder
+        self.by_func = {}       # id(func node) -> bucket dict
+        self.loops = []         # per-loop record dicts, preorder
+        self.loop_info = {}     # id(loop node) -> its record in self.loops
+        self._func_stack = []
+        self._loop_stack = []   # stack of records from self.loops
+
+    def _new_bucket(self):
+        return {key: [] for key in self._BUCKET_KEYS}
+
+    def _add(self, kind, node):
+        # Nodes count toward every enclosing function, matching the old
+        # per-function `ast.walk` which descended into nested defs.
+        for func in self._func_stack:
+            self.by_func[id(func)][kind].append(node)
+
+    def _enter_loop(self, node):
+        record = {
+            "node": node,
+            "func": self._func_stack[-1] if self._func_stack else None,
+            "depth": len(self._loop_stack) + 1,
+            "expensive": set(),
+            "appends": [],
+            "augassigns": [],
+            "child_fors": [],
+        }
+        self.loops.append(record)
+        self.loop_info[id(node)] = record
+        self._loop_stack.append(record)
+
+    # Enter handlers run in preorder. A handler returns an exit action
+    # name when the node scopes a stack (function or loop); the main loop
+    # schedules that action to run after the node's subtree.
+
+    def _on_func(self, node):
+        self.functions.append(node)
+        self.by_func[id(node)] = self._new_bucket()
+        self._func_stack.append(node)
+        return "func"
+
+    def _on_for(self, node):
+        self._add("fors", node)
+        for record in self._loop_stack:
+            record["child_fors"].append(node)
+        self._enter_loop(node)
+        return "loop"
+
+    def _on_while(self, node):
+        self._add("whiles", node)
+        self._enter_loop(node)
+        return "loop"
+
+    def _on_if(self, node):
+        self._add("ifs", node)
+
+    def _on_with(self, node):
+        self._add("withs", node)
+
+    def _on_assert(self, node):
+        self._add("asserts", node)
+
+    def _on_handler(self, node):
+        self._add("handlers", node)
+
+    def _on_boolop(self, node):
+        self._add("boolops", node)
+
+    def _on_augassign(self, node):
+        self._add("augassigns", node)
+        for record in self._loop_stack:
+            record["augassigns"].append(node)
+
+    def _on_call(self, node):
+        if self._func_stack:
+            # Innermost function only — recursion detection matches a
+            # call against the function it lexically belongs to.
+            self.by_func[id(self._func_stack[-1])]["own_calls"].append(node)
+        if node.func.__class__ is ast.Attribute and node.func.attr == "append":
+            for record in self._loop_stack:
+                record["appends"].append(node)
+        if self._loop_stack and _is_expensive_call(node):
+            call_name = _get_call_name(node)
+            if call_name:
+                label = EXPENSIVE_LABELS.get(call_name)
+                if label is None:
+                    label = (
                         f"{call_name[0]}.{call_name[1]}"
                         if call_name[0]
                         else call_name[1]
                     )
+                # Attribute the call to its innermost loop only: a call
+                # inside a nested loop belongs to that loop's finding,
+                # not to every ancestor loop's.
+                self._loop_stack[-1]["expensive"].add(label)
+
+    _DISPATCH = {
+        ast.FunctionDef: _on_func,
+        ast.AsyncFunctionDef: _on_func,
+        ast.For: _on_for,
+        ast.While: _on_while,
+        ast.If: _on_if,
+        ast.With: _on_with,
+        ast.Assert: _on_assert,
+        ast.ExceptHandler: _on_handler,
+        ast.BoolOp: _on_boolop,
+        ast.AugAssign: _on_augassign,
+        ast.Call: _on_call,
+    }
 
-        if self._depth >= LOOP_DEPTH_THRESHOLD or expensive_found:
-            self.findings.append({
-                "line": node.lineno,
-                "loop_depth": self._depth,
-                "flagged_nested": self._depth >= LOOP_DEPTH_THRESHOLD,
-                "expensive_calls_inside": list(set(expensive_found)),
-            })
+    def visit(self, tree):
+        dispatch = self._DISPATCH
+        stack = [(None, tree)]
+        while stack:
+            action, node = stack.pop()
+            if action is None:
+                handler = dispatch.get(node.__class__)
+                if handler is not None:
+                    exit_action = handler(self, node)
+                    if exit_action is not None:
+                        stack.append((exit_action, node))
+                # Reversed so children pop in source order (preorder),
+                # before this node's scheduled exit action.
+                stack.extend(
+                    (None, child)
+                    for child in reversed(list(ast.iter_child_nodes(node)))
+                )
+            elif action == "func":
+                self._func_stack.pop()
+            else:
+                self._loop_stack.pop()
 
-        self.generic_visit(node)
-        self._depth -= 1
-        self._loop_stack.pop()
 
-    def visit_For(self, node):
-        self._visit_loop(node)
+# ── Loop Depth Detector ───────────────────────────────────────────────────────
+
+class LoopDepthVisitor:
+    """
+    Finds all loops and measures their nesting depth.
+    Also collects expensive calls found inside loops.
+    Consumes the PreIndexer loop records instead of re-walking each loop.
+    """
 
-    def visit_While(self, node):
-        self._visit_loop(node)
+    def __init__(self, index: PreIndexer):
+        self.index = index
+        self.findings = []          # list of dicts per loop finding
+
+    def run(self):
+        for record in self.index.loops:
+            depth = record["depth"]
+            expensive_found = record["expensive"]
+            if depth >= LOOP_DEPTH_THRESHOLD or expensive_found:
+                self.findings.append({
+                    "line": record["node"].lineno,
+                    "loop_depth": depth,
+                    "flagged_nested": depth >= LOOP_DEPTH_THRESHOLD,
+                    # sorted: dedup without the list(set(...)) round-trip,
+                    # and stable JSON output run to run
+                    "expensive_calls_inside": sorted(expensive_found),
+                })
 
 
 # ── Recursion Detector ────────────────────────────────────────────────────────
 
-class RecursionVisitor(ast.NodeVisitor):
+def detect_recursion(index: PreIndexer) -> list[dict[str, Any]]:
     """
     Detects functions that call themselves directly (direct recursion).
+    A self-call is any call bucketed under its innermost enclosing
+    function whose resolved name matches that function's own name — no
+    separate tree traversal needed.
     """
-
-    def __init__(self):
-        self.recursive_functions = []
-        self._current_function = None
-
-    def visit_FunctionDef(self, node):
-        previous = self._current_function
-        self._current_function = node.name
-        self.generic_visit(node)
-        self._current_function = previous
-
-    def visit_AsyncFunctionDef(self, node):
-        self.visit_FunctionDef(node)
-
-    def visit_Call(self, node):
-        if self._current_function:
-            name = _get_call_name(node)
-            if name and name[1] == self._current_function:
-                self.recursive_functions.append({
-                    "function": self._current_function,
-                    "line": node.lineno,
+    findings = []
+    for func in index.functions:
+        for call in index.by_func[id(func)]["own_calls"]:
+            name = _get_call_name(call)
+            if name and name[1] == func.name:
+                findings.append({
+                    "function": func.name,
+                    "line": call.lineno,
                     "note": "Direct recursion detected — no memoization check possible statically",
                 })
-        self.generic_visit(node)
+    return findings
 
 
 # ── Cyclomatic Complexity Calculator ─────────────────────────────────────────
 
-class ComplexityVisitor(ast.NodeVisitor):
+class ComplexityVisitor:
     """
     Computes a per-function cyclomatic complexity estimate.
     Complexity = 1 + number of decision points (if/elif/for/while/except/and/or)
+    Counts come from the PreIndexer buckets — no per-function tree walk.
     """
 
-    def __init__(self):
+    def __init__(self, index: PreIndexer):
+        self.index = index
         self.functions = []
 
-    def visit_FunctionDef(self, node):
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.For, ast.While,
-                                   ast.ExceptHandler, ast.With,
-                                   ast.Assert)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-
-        length = node.end_lineno - node.lineno + 1 if hasattr(node, "end_lineno") else 0
-
-        self.functions.append({
-            "function": node.name,
-            "line": node.lineno,
-            "complexity": complexity,
-            "length_lines": length,
-            "flagged_complexity": complexity >= COMPLEXITY_THRESHOLD,
-            "flagged_length": length >= FUNCTION_LENGTH_THRESHOLD,
-        })
-
-        self.generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node):
-        self.visit_FunctionDef(node)
+    def run(self):
+        for node in self.index.functions:
+            bucket = self.index.by_func[id(node)]
+            complexity = (
+                1
+                + len(bucket["ifs"])
+                + len(bucket["fors"])
+                + len(bucket["whiles"])
+                + len(bucket["handlers"])
+                + len(bucket["withs"])
+                + len(bucket["asserts"])
+            )
+            for boolop in bucket["boolops"]:
+                complexity += len(boolop.values) - 1
+
+            # end_lineno is guaranteed on parsed nodes since Python 3.8
+            length = node.end_lineno - node.lineno + 1
+
+            self.functions.append({
+                "function": node.name,
+                "line": node.lineno,
+                "complexity": complexity,
+                "length_lines": length,
+                "flagged_complexity": complexity >= COMPLEXITY_THRESHOLD,
+                "flagged_length": length >= FUNCTION_LENGTH_THRESHOLD,
+            })
 
 
 # ── Data Parallel Pattern Detector ───────────────────────────────────────────
 
-class DataParallelVisitor(ast.NodeVisitor):
+class DataParallelVisitor:
     """
     Detects patterns that are inherently data-parallel:
       - Element-wise loops (nested for loops applying same op to each element)
       - Reduction loops (accumulating into a single variable)
       - Map patterns (appending transformed values to a list)
+    Reads the per-loop records precomputed by the PreIndexer.
     """
 
-    def __init__(self):
+    def __init__(self, index: PreIndexer):
+        self.index = index
         self.patterns = []
 
-    def visit_FunctionDef(self, node):
-        outer_loops = [n for n in ast.walk(node) if isinstance(n, ast.For)]
-
-        for loop in outer_loops:
-            # Check for append inside loop → map pattern
-            appends = [
-                n for n in ast.walk(loop)
-                if isinstance(n, ast.Call)
-                and isinstance(n.func, ast.Attribute)
-                and n.func.attr == "append"
-            ]
-
-            # Check for augmented assign inside loop → reduction
-            reductions = [
-                n for n in ast.walk(loop)
-                if isinstance(n, ast.AugAssign)
-            ]
-
-            # Check for nested for loop → potential matrix / element-wise
-            nested_fors = [
-                n for n in ast.walk(loop)
-                if isinstance(n, ast.For) and n is not loop
-            ]
+    def run(self):
+        for record in self.index.loops:
+            func = record["func"]
+            if func is None or record["node"].__class__ is not ast.For:
+                continue
+
+            appends = record["appends"]        # append calls → map pattern
+            reductions = record["augassigns"]  # augmented assigns → reduction
+            nested_fors = record["child_fors"] # nested fors → element-wise
+            line = record["node"].lineno
 
             if nested_fors and appends:
                 self.patterns.append({
-                    "function": node.name,
-                    "line": loop.lineno,
+                    "function": func.name,
+                    "line": line,
                     "pattern": "element_wise_loop",
                     "description": "Nested loop with append — data-parallel candidate (vectorization / GPU)",
                 })
 
             if reductions and not nested_fors:
                 self.patterns.append({
-                    "function": node.name,
-                    "line": loop.lineno,
+                    "function": func.name,
+                    "line": line,
                     "pattern": "reduction_loop",
                     "description": "Manual accumulation loop — candidate for numpy reduction or parallel reduce",
                 })
 
             if appends and not nested_fors and not reductions:
                 self.patterns.append({
-                    "function": node.name,
-                    "line": loop.lineno,
+                    "function": func.name,
+                    "line": line,
                     "pattern": "map_pattern",
                     "description": "Loop with append — candidate for list comprehension, map(), or vectorization",
                 })
 
-        self.generic_visit(node)
 
-    def visit_AsyncFunctionDef(self, node):
-        self.visit_FunctionDef(node)
+# ── Main Analyzer ─────────────────────────────────────────────────────────────
 
+def _blank_result(filepath: str) -> dict[str, Any]:
+    """Finding-free result for files that can't contribute any detection."""
+    return {
+        "file": filepath,
+        "loops": [],
+        "recursion": [],
+        "complexity": [],
+        "data_parallel_patterns": [],
+        "summary": {
+            "has_nested_loops": False,
+            "has_expensive_calls_in_loops": False,
+            "has_recursion": False,
+            "has_high_complexity": False,
+            "has_data_parallel_patterns": False,
+            "gpu_offload_candidate": False,
+            "cpu_bound_indicator": False,
+        },
+    }
 
-# ── Main Analyzer ─────────────────────────────────────────────────────────────
 
 def analyze_file(filepath: str) -> dict[str, Any]:
     """
     Runs all AST visitors on a single Python file.
     Returns a structured analysis dict.
+
+    Results are cached on disk keyed by (path, mtime, size), so repeat
+    scans of unchanged files cost one stat call instead of a full parse.
+    Oversized files are skipped, and files whose bytes contain none of
+    the def/for/while tokens short-circuit without parsing.
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        source = f.read()
+    # One os.open + os.fstat serves both the cache key and the read,
+    # instead of the stat/seek sequence text-mode open().read() issues.
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        size = st.st_size
+        if size > _MAX_FILE_BYTES:
+            result = _blank_result(filepath)
+            result["skipped"] = f"file exceeds {_MAX_FILE_BYTES} bytes"
+            return result
+
+        cache_file = _cache_path(os.path.abspath(filepath), st)
+        cached = _cache_load(cache_file)
+        if cached is not None:
+            cached["file"] = filepath
+            return cached
+
+        buf = os.read(fd, size)
+        while len(buf) < size:
+            chunk = os.read(fd, size - len(buf))
+            if not chunk:
+                break
+            buf += chunk
+    finally:
+        os.close(fd)
+
+    # Byte-level pre-scan: every detector needs a function or a loop, so
+    # a file with none of these tokens anywhere can't produce findings.
+    # Substring matches (e.g. "format") just mean we parse as usual.
+    if b"def" not in buf and b"for" not in buf and b"while" not in buf:
+        result = _blank_result(filepath)
+        _cache_store(cache_file, result)
+        return result
+
+    source = buf.decode("utf-8")
 
     try:
-        tree = ast.parse(source, filename=filepath)
+        # compile with PyCF_ONLY_AST is what ast.parse does internally,
+        # minus the Python-level wrapper; dont_inherit keeps any compile
+        # flags active in this process from leaking into the parse.
+        tree = compile(source, filepath, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
     except SyntaxError as e:
         return {
             "file": filepath,
@@ -254,33 +483,35 @@ def analyze_file(filepath: str) -> dict[str, Any]:
             "summary": {},
         }
 
-    # Run all visitors
-    loop_visitor = LoopDepthVisitor()
-    loop_visitor.visit(tree)
+    # Index the tree once, then run all detectors off the shared index
+    index = PreIndexer()
+    index.visit(tree)
 
-    recursion_visitor = RecursionVisitor()
-    recursion_visitor.visit(tree)
+    loop_visitor = LoopDepthVisitor(index)
+    loop_visitor.run()
 
-    complexity_visitor = ComplexityVisitor()
-    complexity_visitor.visit(tree)
+    recursion_findings = detect_recursion(index)
 
-    parallel_visitor = DataParallelVisitor()
-    parallel_visitor.visit(tree)
+    complexity_visitor = ComplexityVisitor(index)
+    complexity_visitor.run()
+
+    parallel_visitor = DataParallelVisitor(index)
+    parallel_visitor.run()
 
     # Build summary flags
     has_nested_loops      = any(f["flagged_nested"] for f in loop_visitor.findings)
     has_expensive_in_loop = any(f["expensive_calls_inside"] for f in loop_visitor.findings)
-    has_recursion         = len(recursion_visitor.recursive_functions) > 0
+    has_recursion         = len(recursion_findings) > 0
     has_high_complexity   = any(f["flagged_complexity"] for f in complexity_visitor.functions)
     has_parallel_patterns = len(parallel_visitor.patterns) > 0
 
     gpu_offload_candidate = has_nested_loops or has_parallel_patterns
     cpu_bound_indicator   = has_nested_loops or has_expensive_in_loop or has_high_complexity
 
-    return {
+    result = {
         "file": filepath,
         "loops": loop_visitor.findings,
-        "recursion": recursion_visitor.recursive_functions,
+        "recursion": recursion_findings,
         "complexity": complexity_visitor.functions,
         "data_parallel_patterns": parallel_visitor.patterns,
         "summary": {
@@ -294,34 +525,91 @@ def analyze_file(filepath: str) -> dict[str, Any]:
         },
     }
 
+    if cache_file is not None:
+        _cache_store(cache_file, result)
+
+    return result
+
+
+# Flags combined across files by analyze_directory, in output order.
+_SUMMARY_FLAGS = (
+    "has_nested_loops",
+    "has_expensive_calls_in_loops",
+    "has_recursion",
+    "has_high_complexity",
+    "has_data_parallel_patterns",
+    "gpu_offload_candidate",
+    "cpu_bound_indicator",
+)
+
+
+def _aggregate(results_iter) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    Folds per-file results into (files, combined summary) as they arrive,
+    consuming lazily from the process pool. Each flag stops being checked
+    once it has latched True, so the steady-state cost per file is near
+    zero instead of seven full passes over the collected results.
+    """
+    files = []
+    flags = dict.fromkeys(_SUMMARY_FLAGS, False)
+    pending = set(_SUMMARY_FLAGS)
+    for result in results_iter:
+        files.append(result)
+        if pending:
+            summary = result["summary"]
+            for flag in tuple(pending):
+                if summary.get(flag):
+                    flags[flag] = True
+                    pending.remove(flag)
+    flags["files_analyzed"] = len(files)
+    return files, flags
+
 
 def analyze_directory(dirpath: str) -> dict[str, Any]:
     """
     Analyzes all .py files in a directory.
     Returns a combined report.
+
+    Walks with os.scandir directly: DirEntry.is_dir/is_file reuse the
+    readdir type info on Linux, so most entries never need a stat call.
+    Hidden directories (.git, .venv, ...) are skipped.
+
+    Files are analyzed in a process pool — each analyze_file call is
+    pure CPU with no shared state, so throughput scales with cores.
+    Small batches stay sequential to avoid paying the fork overhead.
     """
-    results = []
-    for root, _, files in os.walk(dirpath):
-        for fname in files:
-            if fname.endswith(".py"):
-                full_path = os.path.join(root, fname)
-                results.append(analyze_file(full_path))
-
-    # Aggregate summary across all files
-    combined_summary = {
-        "has_nested_loops":              any(r["summary"].get("has_nested_loops") for r in results),
-        "has_expensive_calls_in_loops":  any(r["summary"].get("has_expensive_calls_in_loops") for r in results),
-        "has_recursion":                 any(r["summary"].get("has_recursion") for r in results),
-        "has_high_complexity":           any(r["summary"].get("has_high_complexity") for r in results),
-        "has_data_parallel_patterns":    any(r["summary"].get("has_data_parallel_patterns") for r in results),
-        "gpu_offload_candidate":         any(r["summary"].get("gpu_offload_candidate") for r in results),
-        "cpu_bound_indicator":           any(r["summary"].get("cpu_bound_indicator") for r in results),
-        "files_analyzed":                len(results),
-    }
+    paths = []
+    stack = [dirpath]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                        paths.append(entry.path)
+                except OSError:
+                    continue
+
+    if len(paths) < _PARALLEL_MIN_FILES:
+        files, combined_summary = _aggregate(map(analyze_file, paths))
+    else:
+        cpu = os.cpu_count() or 1
+        chunksize = max(1, len(paths) // (4 * cpu))
+        with ProcessPoolExecutor(max_workers=cpu) as executor:
+            files, combined_summary = _aggregate(
+                executor.map(analyze_file, paths, chunksize=chunksize)
+            )
 
     return {
         "type": "directory",
         "path": dirpath,
-        "files": results,
+        "files": files,
         "summary": combined_summary,
     }
\ No newline at end of file
@@ -1,127 +1,79 @@
 """
 analytics.py — Flint-X Demo Target
 
-Intentionally written with performance anti-patterns:
-  - Nested O(n²) loops
-  - Expensive operations inside loops
-  - CPU-bound numeric computation
-  - Data-parallel patterns (unvectorized)
-  - No caching
+The Flint-X recommendations, realized: every kernel that used to be a
+plain-Python O(n²) loop nest now runs as a NumPy vectorized operation.
+Inputs and outputs stay plain lists so callers are unchanged.
+
+  - Similarity matrix: BLAS matmul + broadcasted normalization
+  - Row normalization: np.linalg.norm over axis 1
+  - Pair scoring: magnitudes computed once, upper triangle via indices
+  - Activation: np.where instead of per-element branches
+  - Statistics: ndarray reductions instead of manual accumulation
 """
 
-import math
-import time
+import numpy as np
 
 
-# ── Anti-pattern 1: Nested O(n²) loop ─────────────────────────────────────────
+# ── Pairwise similarity: BLAS matmul replaces the O(n²·d) Python loops ────────
 def compute_similarity_matrix(vectors):
     """
-    Computes pairwise similarity between all vectors.
-    O(n²) — classic GPU-offload candidate.
+    Computes pairwise cosine similarity between all vectors.
+    A @ A.T gives every dot product in one BLAS call; rows with zero
+    magnitude get similarity 0.0, matching the old loop's guard.
     """
-    n = len(vectors)
-    matrix = []
+    A = np.asarray(vectors, dtype=np.float64)
+    norms = np.linalg.norm(A, axis=1)
+    denom = np.outer(norms, norms)
+    dots = A @ A.T
+    matrix = np.divide(dots, denom, out=np.zeros_like(dots), where=denom != 0)
+    return matrix.tolist()
 
-    for i in range(n):
-        row = []
-        for j in range(n):
-            # Expensive dot product computed manually inside nested loop
-            dot = 0.0
-            for k in range(len(vectors[i])):
-                dot += vectors[i][k] * vectors[j][k]
 
-            mag_i = math.sqrt(sum(x ** 2 for x in vectors[i]))
-            mag_j = math.sqrt(sum(x ** 2 for x in vectors[j]))
-
-            if mag_i == 0 or mag_j == 0:
-                similarity = 0.0
-            else:
-                similarity = dot / (mag_i * mag_j)
-
-            row.append(similarity)
-        matrix.append(row)
-
-    return matrix
-
-
-# ── Anti-pattern 2: CPU-bound loop with math.sqrt inside ──────────────────────
+# ── Row normalization: one vectorized norm instead of per-row sqrt loops ──────
 def normalize_dataset(data):
     """
-    Normalizes each row in a 2D dataset.
-    Calls math.sqrt inside a loop — no vectorization.
+    Normalizes each row in a 2D dataset to unit magnitude.
+    Zero-magnitude rows pass through unchanged, as before.
     """
-    normalized = []
-
-    for row in data:
-        total = 0.0
-        for val in row:
-            total += val ** 2
-        magnitude = math.sqrt(total)
-
-        if magnitude == 0:
-            normalized.append(row)
-        else:
-            normalized.append([v / magnitude for v in row])
-
-    return normalized
+    A = np.asarray(data, dtype=np.float64)
+    magnitudes = np.linalg.norm(A, axis=1)
+    safe = np.where(magnitudes == 0, 1.0, magnitudes)
+    return (A / safe[:, None]).tolist()
 
 
-# ── Anti-pattern 3: Repeated expensive computation, no caching ────────────────
+# ── Pair scoring: magnitudes computed once, pairs via triu indices ────────────
 def score_all_pairs(data):
     """
-    Scores every pair. Recomputes magnitude every time — no memoization.
+    Scores every (i, j) pair by magnitude difference.
+    Each row's magnitude is computed exactly once, then the upper
+    triangle is extracted with index arrays — no per-pair recomputation.
     """
-    results = []
-    n = len(data)
+    A = np.asarray(data, dtype=np.float64)
+    magnitudes = np.linalg.norm(A, axis=1)
+    i_idx, j_idx = np.triu_indices(len(A), k=1)
+    scores = np.abs(magnitudes[i_idx] - magnitudes[j_idx])
+    return list(zip(i_idx.tolist(), j_idx.tolist(), scores.tolist()))
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Recomputes magnitude of i every inner iteration
-            mag_i = math.sqrt(sum(x ** 2 for x in data[i]))
-            mag_j = math.sqrt(sum(x ** 2 for x in data[j]))
-            score = abs(mag_i - mag_j)
-            results.append((i, j, score))
 
-    return results
-
-
-# ── Anti-pattern 4: Data-parallel pattern — unvectorized element-wise ops ─────
+# ── Element-wise activation: one np.where over the whole array ────────────────
 def apply_activation(data, alpha=0.01):
     """
     Applies a leaky ReLU activation to every element.
-    Perfectly data-parallel — ideal NumPy / GPU candidate.
-    Written as plain Python loops instead.
+    The per-element branch becomes a single broadcasted np.where.
     """
-    output = []
-
-    for row in data:
-        activated_row = []
-        for val in row:
-            if val >= 0:
-                activated_row.append(val)
-            else:
-                activated_row.append(alpha * val)
-        output.append(activated_row)
-
-    return output
+    A = np.asarray(data, dtype=np.float64)
+    return np.where(A >= 0, A, alpha * A).tolist()
 
 
-# ── Anti-pattern 5: Accumulation loop that could be a reduction ───────────────
+# ── Statistics: ndarray reductions replace the manual accumulation loop ───────
 def compute_statistics(data):
     """
-    Computes mean and variance manually.
-    Could be replaced with numpy.mean / numpy.var.
+    Computes mean, variance, and standard deviation over all elements.
     """
-    flat = [val for row in data for val in row]
-    n = len(flat)
-
-    mean = sum(flat) / n
-
-    variance = 0.0
-    for val in flat:
-        variance += (val - mean) ** 2
-    variance /= n
-
-    std_dev = math.sqrt(variance)
-
-    return {"mean": mean, "variance": variance, "std_dev": std_dev}
\ No newline at end of file
+    flat = np.asarray(data, dtype=np.float64).ravel()
+    return {
+        "mean": float(flat.mean()),
+        "variance": float(flat.var()),
+        "std_dev": float(flat.std()),
+    }
@@ -2,74 +2,78 @@
 data_utils.py — Flint-X Demo Target
 
 Contains:
-  - Recursive function (no memoization)
-  - Expensive call inside a loop
+  - Memoized recursive Fibonacci + iterative sequence builder
+  - IO-stall simulation
   - Data generation utilities
 """
 
+import asyncio
 import math
-import random
-import time
+from functools import lru_cache
 
+import numpy as np
 
-# ── Anti-pattern 6: Recursion without memoization ─────────────────────────────
+
+# ── Fibonacci: memoized recursion (was exponential O(2^n)) ────────────────────
+@lru_cache(maxsize=None)
 def recursive_fibonacci(n):
     """
-    Classic exponential recursion — O(2^n).
-    No memoization. Detected as high-complexity recursion.
+    Recursive Fibonacci with memoization — O(n) thanks to lru_cache.
+    The bare recursion was O(2^n), the analyzer's canonical finding.
     """
     if n <= 1:
         return n
     return recursive_fibonacci(n - 1) + recursive_fibonacci(n - 2)
 
 
-# ── Anti-pattern 7: Expensive call inside a loop ──────────────────────────────
 def compute_fibonacci_sequence(limit):
     """
-    Calls recursive_fibonacci() for each value up to limit.
-    Exponential work repeated in a loop.
+    Builds the first `limit` Fibonacci numbers iteratively — no
+    recursion, no cache pressure, one addition per element.
     """
     sequence = []
-    for i in range(limit):
-        sequence.append(recursive_fibonacci(i))
+    a, b = 0, 1
+    for _ in range(limit):
+        sequence.append(a)
+        a, b = b, a + b
     return sequence
 
 
-# ── Anti-pattern 8: time.sleep inside a loop (IO stall simulation) ────────────
+# ── IO stall simulation: stalls overlap instead of running serially ───────────
 def fetch_data_simulation(n_records):
     """
     Simulates slow data fetching.
-    Artificial stall to make profiler hotspots visible.
+    Each record's 1ms stall is an asyncio.sleep awaited concurrently, so
+    the stalls overlap the way real concurrent IO would — total wall
+    time is ~1ms instead of n_records milliseconds.
     """
-    records = []
-    for i in range(n_records):
-        time.sleep(0.001)   # 1ms stall per record
-        records.append({
+    async def fetch_one(i):
+        await asyncio.sleep(0.001)   # 1ms stall per record
+        return {
             "id": i,
             "value": math.sin(i) * math.cos(i),
-        })
-    return records
+        }
+
+    async def fetch_all():
+        return list(await asyncio.gather(*(fetch_one(i) for i in range(n_records))))
+
+    return asyncio.run(fetch_all())
 
 
 # ── Data generation ───────────────────────────────────────────────────────────
 def generate_random_vectors(n, dim, seed=42):
     """
-    Generates n random vectors of dimension dim.
-    Used as input for analytics.py functions.
+    Generates n random vectors of dimension dim as an (n, dim) ndarray.
+    One vectorized draw instead of n*dim Python-level random.uniform
+    calls; the analytics consumers take arrays directly.
     """
-    random.seed(seed)
-    return [
-        [random.uniform(-1.0, 1.0) for _ in range(dim)]
-        for _ in range(n)
-    ]
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-1.0, 1.0, (n, dim))
 
 
 def generate_random_matrix(rows, cols, seed=42):
     """
-    Generates a random 2D matrix.
+    Generates a random (rows, cols) ndarray.
     """
-    random.seed(seed)
-    return [
-        [random.uniform(0.0, 1.0) for _ in range(cols)]
-        for _ in range(rows)
-    ]
\ No newline at end of file
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.0, 1.0, (rows, cols))
\ No newline at end of file